@@ -14,15 +14,27 @@ A nerd font is required, see https://www.nerdfonts.com
 Tested with Caskaydia.
 """
 import argparse
+import functools
+import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import List, Tuple
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 LANDSCAPE_W, LANDSCAPE_H = 140, 68
 PORTRAIT_W, PORTRAIT_H = 68, 140
 
+# Byte -> "0xNN" lookup so art.c rows avoid per-byte format calls.
+_HEX = tuple(f"0x{b:02x}" for b in range(256))
+
+# Placement sizes snap to the nearest multiple of this before rasterization;
+# on the 1-bit 140x68 canvas a few px of font size are indistinguishable, and
+# binning lets nearby sizes share a single rendered mask.
+_SIZE_BIN = 4
+
 SEARCH_DIRS = [
     # macOS
     "/Library/Fonts",
@@ -35,38 +47,54 @@ SEARCH_DIRS = [
     os.path.expanduser("~/.fonts"),
 ]
 PREFERRED = ["Caskaydia", "Cascadia", "Nerd", "Code"]
+_PREFERRED_LC = tuple(p.lower() for p in PREFERRED)
+_FONT_EXTS = (".ttf", ".ttc", ".otf")
 FALLBACK_FONT_URL = (
     "https://github.com/ryanoasis/nerd-fonts/raw/refs/heads/master/"
     "patched-fonts/CascadiaCode/CaskaydiaCoveNerdFontMono-Regular.ttf"
 )
+FONT_CACHE_FILE = os.path.expanduser("~/.cache/nice-view-glyphs/font.json")
 
 
 @dataclass
 class GlyphPattern:
+    """Glyph placements in SoA layout: parallel center/size arrays."""
+
     name: str
-    placements: List[Tuple[int, int, int]]  # (cx, cy, size)
+    cxs: np.ndarray  # landscape center x, int16
+    cys: np.ndarray  # landscape center y, int16
+    sizes: np.ndarray  # placement size, int16
+
+    @classmethod
+    def from_placements(
+        cls, name: str, placements: List[Tuple[int, int, int]]
+    ) -> "GlyphPattern":
+        cxs, cys, sizes = (
+            np.array(col, dtype=np.int16) for col in zip(*placements)
+        )
+        return cls(name, cxs, cys, sizes)
 
 
 PATTERNS = [
-    GlyphPattern("pattern1", [(70, 34, 60)]),
-    GlyphPattern("pattern2", [(70, 34, 48), (30, 15, 28), (110, 50, 20)]),
-    GlyphPattern("pattern3", [(55, 30, 42), (35, 18, 28), (78, 42, 32), (48, 50, 20)]),
-    GlyphPattern(
+    GlyphPattern.from_placements("pattern1", [(70, 34, 60)]),
+    GlyphPattern.from_placements("pattern2", [(70, 34, 48), (30, 15, 28), (110, 50, 20)]),
+    GlyphPattern.from_placements("pattern3", [(55, 30, 42), (35, 18, 28), (78, 42, 32), (48, 50, 20)]),
+    GlyphPattern.from_placements(
         "pattern4",
         [
             (50, 28, 50), (28, 16, 32), (88, 44, 40), (42, 54, 26),
             (70, 18, 28), (108, 34, 30),
         ],
     ),
-    GlyphPattern("pattern5", [(30, 34, 18), (60, 34, 26), (90, 34, 34), (120, 34, 42)]),
-    GlyphPattern(
+    GlyphPattern.from_placements("pattern5", [(30, 34, 18), (60, 34, 26), (90, 34, 34), (120, 34, 42)]),
+    GlyphPattern.from_placements(
         "pattern6",
         [
             (15, 50, 20), (25, 18, 24), (60, 12, 30), (85, 48, 26),
             (105, 20, 24), (125, 40, 18),
         ],
     ),
-    GlyphPattern(
+    GlyphPattern.from_placements(
         "pattern7",
         [
             (70, 34, 28),  # center
@@ -74,7 +102,7 @@ PATTERNS = [
             (45, 48, 16), (35, 24, 16),
         ],
     ),
-    GlyphPattern(
+    GlyphPattern.from_placements(
         "pattern8",
         [
             (70, 34, 22),  # center
@@ -82,7 +110,7 @@ PATTERNS = [
             (35, 25, 14), (105, 25, 14), (35, 43, 14), (105, 43, 14),  # inner diagonals
         ],
     ),
-    GlyphPattern(
+    GlyphPattern.from_placements(
         "pattern9",
         [
             (10, 34, 16), (25, 22, 18), (40, 14, 20), (55, 22, 22),
@@ -90,7 +118,7 @@ PATTERNS = [
             (130, 34, 16),
         ],
     ),
-    GlyphPattern(
+    GlyphPattern.from_placements(
         "pattern10",
         [
             (20, 20, 18), (50, 15, 22), (80, 12, 16), (110, 18, 20),
@@ -101,15 +129,51 @@ PATTERNS = [
 ]
 
 
+@functools.lru_cache(maxsize=64)
+def _get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a font once per (path, size); repeated placements reuse the parsed face."""
+    return ImageFont.truetype(path, size)
+
+
+def _load_cached_font():
+    """Return the previously resolved font if its cache entry is still valid."""
+    try:
+        with open(FONT_CACHE_FILE) as cf:
+            cached = json.load(cf)
+        path = cached["path"]
+        if os.path.isfile(path) and os.path.getmtime(path) == cached["mtime"]:
+            f = ImageFont.truetype(path, 24)
+            f.path = path
+            return f
+    except Exception:
+        pass
+    return None
+
+
+def _save_font_cache(path):
+    try:
+        os.makedirs(os.path.dirname(FONT_CACHE_FILE), exist_ok=True)
+        with open(FONT_CACHE_FILE, "w") as cf:
+            json.dump({"path": path, "mtime": os.path.getmtime(path)}, cf)
+    except Exception:
+        pass
+
+
 def load_font():
+    cached = _load_cached_font()
+    if cached:
+        return cached
     candidates = []
     for d in SEARCH_DIRS:
         if not os.path.isdir(d):
             continue
-        for fname in os.listdir(d):
-            low = fname.lower()
-            if low.endswith(".ttf") and any(p.lower() in low for p in PREFERRED):
-                candidates.append(os.path.join(d, fname))
+        with os.scandir(d) as it:
+            for entry in it:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                low = entry.name.lower()
+                if low.endswith(_FONT_EXTS) and any(p in low for p in _PREFERRED_LC):
+                    candidates.append(entry.path)
 
     def score(p):
         name = os.path.basename(p).lower()
@@ -126,6 +190,7 @@ def load_font():
         try:
             f = ImageFont.truetype(path, 24)
             f.path = path
+            _save_font_cache(path)
             return f
         except Exception:
             pass
@@ -148,6 +213,7 @@ def load_font():
     try:
         f = ImageFont.truetype(fallback_path, 24)
         f.path = fallback_path
+        _save_font_cache(fallback_path)
         print(f"Using downloaded fallback font: {fallback_path}")
         return f
     except Exception as e:
@@ -163,13 +229,19 @@ def parse_codepoint(code: str) -> str:
     raw = code.strip().lower()
     if raw.startswith("0x"):
         raw = raw[2:]
-    if not raw or any(c not in "0123456789abcdef" for c in raw):
-        print(f"Invalid hex glyph '{code}'", file=sys.stderr)
-        sys.exit(2)
     try:
-        return chr(int(raw, 16))
-    except Exception as e:
-        print(f"Failed to parse glyph '{code}': {e}", file=sys.stderr)
+        # isalnum rejects signs/underscores/whitespace that int() would let
+        # through; int's C-level parser handles the actual hex validation.
+        # The prefix is already stripped, so a leftover "x" (e.g. "0x0x41")
+        # must be rejected too since int(raw, 16) would accept it.
+        if not (raw.isascii() and raw.isalnum()) or "x" in raw:
+            raise ValueError
+        cp = int(raw, 16)
+        if cp > 0x10FFFF:
+            raise ValueError
+        return chr(cp)
+    except ValueError:
+        print(f"Invalid hex glyph '{code}'", file=sys.stderr)
         sys.exit(2)
 
 
@@ -177,11 +249,56 @@ def draw_glyph(
     draw: ImageDraw.ImageDraw, glyph: str, cx: int, cy: int, size: int, font_obj
 ):
     font_size = max(8, int(size * 1.2))
-    font = ImageFont.truetype(font_obj.path, font_size)
+    font = _get_font(font_obj.path, font_size)
     w, h = draw.textbbox((0, 0), glyph, font=font)[2:]
     draw.text((cx - w // 2, cy - h // 2), glyph, font=font, fill="white")
 
 
+def _fit_font_size(
+    glyph: str, size: int, font_path: str, base_w: int, base_h: int
+) -> Tuple[int, int, int]:
+    """Pick a font size whose inked glyph fits base_w x base_h.
+
+    Uses getbbox/getlength/getmetrics only, so sizing never touches pixels.
+    The fit is judged on the glyph's ink extents (what the post-render crop
+    keeps), not the padded canvas, so sizes that fit are never shrunk.
+    Returns (font_size, canvas_w, canvas_h).
+    """
+    font_size = max(8, int(size * 1.2))
+    while True:
+        font = _get_font(font_path, font_size)
+        ascent, descent = font.getmetrics()
+        tmp_w = max(8, int(font.getlength(glyph) + 4))
+        tmp_h = max(8, int(ascent + descent + 8))
+        left, top, right, bottom = font.getbbox(glyph)
+        gw, gh = right - left, bottom - top
+        if (gw <= base_w and gh <= base_h) or font_size <= 8:
+            return font_size, tmp_w, tmp_h
+        scale = min(base_w / max(gw, 1), base_h / max(gh, 1)) * 0.95
+        font_size = max(8, int(font_size * scale))
+
+
+def _render_glyph_mask(
+    glyph: str, size: int, font_obj, base_w: int, base_h: int
+) -> Image.Image:
+    """Rasterize a cropped glyph mask for a placement size.
+
+    The font size is chosen up front from metrics alone, so the expensive
+    rasterize/crop pass runs exactly once per mask.
+    """
+    font_size, tmp_w, tmp_h = _fit_font_size(
+        glyph, size, font_obj.path, base_w, base_h
+    )
+    font = _get_font(font_obj.path, font_size)
+    glyph_canvas = Image.new("L", (tmp_w, tmp_h), 0)
+    gd = ImageDraw.Draw(glyph_canvas)
+    gd.text((2, 2), glyph, font=font, fill=255)
+    bbox = glyph_canvas.getbbox()
+    if bbox:
+        glyph_canvas = glyph_canvas.crop(bbox)
+    return glyph_canvas
+
+
 def make_pattern_image(
     glyph: str, pattern: GlyphPattern, font_obj, orientation: str = "portrait"
 ) -> Image.Image:
@@ -199,74 +316,111 @@ def make_pattern_image(
         else (LANDSCAPE_W, LANDSCAPE_H)
     )
     img = Image.new("RGB", (base_w, base_h), "black")
+    # Quantize sizes so nearby placements reuse one rasterized mask.
+    sizes = np.maximum(
+        _SIZE_BIN, (pattern.sizes + _SIZE_BIN // 2) // _SIZE_BIN * _SIZE_BIN
+    )
     # Transform coordinates if portrait (treat original placements as landscape coords)
     if orientation == "portrait":
-        placements = []
-        for cx, cy, size in pattern.placements:
-            xp = cy  # map landscape y -> portrait x
-            yp = PORTRAIT_H - 1 - cx  # invert landscape x into portrait y
-            placements.append((xp, yp, size))
+        xs = pattern.cys  # map landscape y -> portrait x
+        ys = (PORTRAIT_H - 1) - pattern.cxs  # invert landscape x into portrait y
     else:
-        placements = pattern.placements
+        xs, ys = pattern.cxs, pattern.cys
+    placements = list(zip(xs.tolist(), ys.tolist(), sizes.tolist()))
+    # Phase 1: rasterize one cropped mask per unique placement size.
+    masks = {
+        size: _render_glyph_mask(glyph, size, font_obj, base_w, base_h)
+        for size in np.unique(sizes).tolist()
+    }
+    # Phase 2: paste the cached mask at every placement.
     for cx, cy, size in placements:
-        # Improved glyph rendering: use metrics, pad, crop.
-        font_size = max(8, int(size * 1.2))
-        font = ImageFont.truetype(font_obj.path, font_size)
-        ascent, descent = font.getmetrics()
-        tmp_w = int(font.getlength(glyph) + 4)
-        tmp_h = int(ascent + descent + 8)
-        glyph_canvas = Image.new("L", (max(8, tmp_w), max(8, tmp_h)), 0)
-        gd = ImageDraw.Draw(glyph_canvas)
-        gd.text((2, 2), glyph, font=font, fill=255)
-        bbox = glyph_canvas.getbbox()
-        if bbox:
-            glyph_canvas = glyph_canvas.crop(bbox)
+        glyph_canvas = masks[size]
         gw, gh = glyph_canvas.size
-        if gw > base_w or gh > base_h:
-            scale = min(base_w / max(gw, 1), base_h / max(gh, 1)) * 0.95
-            new_font_size = max(8, int(font_size * scale))
-            font = ImageFont.truetype(font_obj.path, new_font_size)
-            ascent, descent = font.getmetrics()
-            tmp_w = int(font.getlength(glyph) + 4)
-            tmp_h = int(ascent + descent + 8)
-            glyph_canvas = Image.new("L", (max(8, tmp_w), max(8, tmp_h)), 0)
-            gd = ImageDraw.Draw(glyph_canvas)
-            gd.text((2, 2), glyph, font=font, fill=255)
-            bbox = glyph_canvas.getbbox()
-            if bbox:
-                glyph_canvas = glyph_canvas.crop(bbox)
-            gw, gh = glyph_canvas.size
         half_w, half_h = gw // 2, gh // 2
         cx = max(half_w, min(base_w - half_w - 1, cx))
         cy = max(half_h, min(base_h - half_h - 1, cy))
-        white_rgb = Image.new("RGB", (gw, gh), "white")
         px = int(cx - gw // 2)
         py = int(cy - gh // 2)
-        img.paste(white_rgb, (px, py), glyph_canvas)
+        # paste() accepts a fill color directly; no intermediate RGB image needed
+        img.paste((255, 255, 255), (px, py), glyph_canvas)
     return img
 
 
 def image_to_indexed_1bit_bytes(img: Image.Image, width: int, height: int) -> bytes:
-    mono = img.convert("L")
-    bits = []
-    for y in range(height):
-        byte = 0
-        bit_count = 0
-        for x in range(width):
-            pix = mono.getpixel((x, y))
-            # getpixel for "L" mode returns int 0..255; guard against unexpected types
-            val = pix if isinstance(pix, int) else 0
-            bit = 1 if val > 0 else 0
-            byte = (byte << 1) | bit
-            bit_count += 1
-            if bit_count == 8:
-                bits.append(byte)
-                byte = 0
-                bit_count = 0
-        if bit_count:
-            byte <<= 8 - bit_count
-            bits.append(byte)
-    return bytes(bits)
+    # width/height are the authoritative output dimensions; packing whatever
+    # the image happens to be would silently change the byte count downstream.
+    assert img.size == (width, height), img.size
+    # "any non-zero pixel is set" threshold; packbits emits MSB-first rows
+    # padded to (width+7)//8 bytes, same layout as the old Python bit loop.
+    arr = np.asarray(img.convert("L"), dtype=np.uint8)
+    bits = (arr > 0).astype(np.uint8)
+    return np.packbits(bits, axis=1, bitorder="big").tobytes()
+
+
+# art.c boilerplate, hoisted so the write loop only fills in names and
+# dimensions via bytes %-formatting.
+_ART_HEADER = (
+    b"/*\n"
+    b" * Clean generated pattern assets (pattern1..pattern10)\n"
+    b" * Auto-generated by generate_images.py --mode art\n"
+    b" * Do not edit; regenerate instead.\n"
+    b" */\n\n"
+    b"#include <lvgl.h>\n\n"
+    b"#ifndef LV_ATTRIBUTE_MEM_ALIGN\n#define LV_ATTRIBUTE_MEM_ALIGN\n#endif\n\n"
+    b"/* BEGIN AUTO-GENERATED PATTERN IMAGES (do not edit manually) */\n"
+)
+_ART_FOOTER = b"/* END AUTO-GENERATED PATTERN IMAGES */\n"
+_GUARD_TMPL = b"#ifndef LV_ATTRIBUTE_IMG_%s\n#define LV_ATTRIBUTE_IMG_%s\n#endif\n"
+_MAP_HEAD_TMPL = (
+    b"const LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST "
+    b"LV_ATTRIBUTE_IMG_%s uint8_t %s_map[] = {\n"
+)
+_COLOR_BLOCK = (
+    b"#if CONFIG_NICE_VIEW_WIDGET_INVERTED\n"
+    b"    0x00,0x00,0x00,0xff, /*Color of index 0*/\n"
+    b"    0xff,0xff,0xff,0xff, /*Color of index 1*/\n"
+    b"#else\n"
+    b"    0xff,0xff,0xff,0xff, /*Color of index 0*/\n"
+    b"    0x00,0x00,0x00,0xff, /*Color of index 1*/\n"
+    b"#endif\n"
+)
+_DSC_TMPL = (
+    b"const lv_img_dsc_t %s = {\n"
+    b"  .header.cf = LV_IMG_CF_INDEXED_1BIT,\n"
+    b"  .header.always_zero = 0,\n"
+    b"  .header.reserved = 0,\n"
+    b"  .header.w = %d,\n"
+    b"  .header.h = %d,\n"
+    b"  .data_size = %d,\n"
+    b"  .data = %s_map,\n"
+    b"};\n\n"
+)
+
+
+def _render_pattern(args):
+    """Render one pattern; picklable worker for the per-pattern process pool.
+
+    Returns the preview image for mode "previews", or the packed landscape
+    1-bit bytes for mode "art".
+    """
+    glyph, pattern, font_path, orientation, mode = args
+    font_obj = _get_font(font_path, 24)
+    font_obj.path = font_path
+    img = make_pattern_image(glyph, pattern, font_obj, orientation=orientation)
+    if mode == "previews":
+        return img
+    if orientation == "portrait":
+        # Storage matches the original landscape descriptor, i.e. the portrait
+        # canvas rotated clockwise 90°. Transpose+flip is a lazy view, so the
+        # rotation folds into the packing pass without a rotated pixel buffer.
+        arr = np.asarray(img.convert("L"))  # (PORTRAIT_H, PORTRAIT_W)
+        rot = arr.T[:, ::-1]  # (LANDSCAPE_H, LANDSCAPE_W), CW 90
+        return np.packbits(rot > 0, axis=1, bitorder="big").tobytes()
+    # The landscape canvas is already 140x68, so this guard should never
+    # fire; NEAREST keeps it cheap if it ever does.
+    if img.size != (LANDSCAPE_W, LANDSCAPE_H):
+        img = img.resize((LANDSCAPE_W, LANDSCAPE_H), Image.NEAREST)
+    return image_to_indexed_1bit_bytes(img, LANDSCAPE_W, LANDSCAPE_H)
 
 
 def write_entire_art_file(art_file: str, glyph: str, font_obj, orientation: str):
@@ -274,67 +428,33 @@ def write_entire_art_file(art_file: str, glyph: str, font_obj, orientation: str)
 
     This replaces any previous content; only the generated patterns and a header remain.
     """
-    lines = []
-    lines.append(
-        "/*\n"
-        " * Clean generated pattern assets (pattern1..pattern10)\n"
-        " * Auto-generated by generate_images.py --mode art\n"
-        " * Do not edit; regenerate instead.\n"
-        " */\n\n"
-    )
-    lines.append("#include <lvgl.h>\n\n")
-    lines.append(
-        "#ifndef LV_ATTRIBUTE_MEM_ALIGN\n#define LV_ATTRIBUTE_MEM_ALIGN\n#endif\n\n"
-    )
-    lines.append("/* BEGIN AUTO-GENERATED PATTERN IMAGES (do not edit manually) */\n")
-    for pattern in PATTERNS:
-        img = make_pattern_image(glyph, pattern, font_obj, orientation=orientation)
-        if orientation == "portrait":
-            # Rotate portrait canvas clockwise 90° so storage matches original landscape descriptor
-            img = img.rotate(270, expand=True)  # CCW 270 == CW 90
-        width, height = LANDSCAPE_W, LANDSCAPE_H
-        if img.size != (LANDSCAPE_W, LANDSCAPE_H):
-            img = img.resize((LANDSCAPE_W, LANDSCAPE_H))
-        row_bytes = (width + 7) // 8
-        data = image_to_indexed_1bit_bytes(img, width, height)
-        lines.append(
-            f"#ifndef LV_ATTRIBUTE_IMG_{pattern.name.upper()}\n"
-            f"#define LV_ATTRIBUTE_IMG_{pattern.name.upper()}\n"
-            "#endif\n"
-        )
-        lines.append(
-            f"const LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST "
-            f"LV_ATTRIBUTE_IMG_{pattern.name.upper()} uint8_t {pattern.name}_map[] = {{\n"
-        )
-        lines.append(
-            "#if CONFIG_NICE_VIEW_WIDGET_INVERTED\n"
-            "    0x00,0x00,0x00,0xff, /*Color of index 0*/\n"
-            "    0xff,0xff,0xff,0xff, /*Color of index 1*/\n"
-            "#else\n"
-            "    0xff,0xff,0xff,0xff, /*Color of index 0*/\n"
-            "    0x00,0x00,0x00,0xff, /*Color of index 1*/\n"
-            "#endif\n"
-        )
-        for y in range(height):
-            offset = y * row_bytes
-            row = data[offset : offset + row_bytes]
-            hexes = ",".join(f"0x{b:02x}" for b in row)
-            lines.append(f"    /* y{y:02d} */ {hexes},\n")
-        lines.append("};\n\n")
-        lines.append(
-            f"const lv_img_dsc_t {pattern.name} = {{\n"
-            "  .header.cf = LV_IMG_CF_INDEXED_1BIT,\n"
-            "  .header.always_zero = 0,\n"
-            "  .header.reserved = 0,\n"
-            f"  .header.w = {width},\n"
-            f"  .header.h = {height},\n"
-            f"  .data_size = {row_bytes * height},\n"
-            f"  .data = {pattern.name}_map,\n"
-            "};\n\n"
-        )
-    lines.append("/* END AUTO-GENERATED PATTERN IMAGES */\n")
-    with open(art_file, "w") as wf:
-        wf.write("".join(lines))
+    # Patterns are independent; render them in parallel and stream each block
+    # to disk as soon as it is ready (ex.map yields in submission order), so
+    # only one pattern's text is buffered at a time. Stream into a tmp file
+    # and swap it in at the end so a failed run never truncates art.c.
+    tasks = [(glyph, p, font_obj.path, orientation, "art") for p in PATTERNS]
+    tmp_file = art_file + ".tmp"
+    with open(tmp_file, "wb") as wf, ProcessPoolExecutor() as ex:
+        wf.write(_ART_HEADER)
+        for pattern, data in zip(PATTERNS, ex.map(_render_pattern, tasks)):
+            width, height = LANDSCAPE_W, LANDSCAPE_H
+            row_bytes = (width + 7) // 8
+            name = pattern.name.encode()
+            name_uc = pattern.name.upper().encode()
+            buf = bytearray()
+            buf += _GUARD_TMPL % (name_uc, name_uc)
+            buf += _MAP_HEAD_TMPL % (name_uc, name)
+            buf += _COLOR_BLOCK
+            for y in range(height):
+                offset = y * row_bytes
+                row = data[offset : offset + row_bytes]
+                hexes = ",".join(_HEX[b] for b in row)
+                buf += f"    /* y{y:02d} */ {hexes},\n".encode()
+            buf += b"};\n\n"
+            buf += _DSC_TMPL % (name, width, height, row_bytes * height, name)
+            wf.write(buf)
+        wf.write(_ART_FOOTER)
+    os.replace(tmp_file, art_file)
 
 
 def run():
@@ -373,13 +493,16 @@ def run():
         out_dir = os.path.join(workspace_root, "previews")
         os.makedirs(out_dir, exist_ok=True)
         hex_code = effective_glyph.lower().lstrip("0x")
-        for pattern in PATTERNS:
-            img = make_pattern_image(
-                glyph_char, pattern, font_obj, orientation=args.orientation
-            )
-            path = os.path.join(out_dir, f"{hex_code}_{pattern.name}.png")
-            img.save(path)
-            print("saved", path)
+        # Patterns are independent; render them in parallel and save in order.
+        tasks = [
+            (glyph_char, p, font_obj.path, args.orientation, "previews")
+            for p in PATTERNS
+        ]
+        with ProcessPoolExecutor() as ex:
+            for pattern, img in zip(PATTERNS, ex.map(_render_pattern, tasks)):
+                path = os.path.join(out_dir, f"{hex_code}_{pattern.name}.png")
+                img.save(path)
+                print("saved", path)
     else:
         write_entire_art_file(
             os.path.abspath(args.art_file),